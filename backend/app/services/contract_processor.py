@@ -3,11 +3,29 @@ import PyPDF2
 import pdfplumber
 import re
 import logging
+import threading
 import nltk
 import spacy
 from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 from fuzzywuzzy import fuzz
+from pymongo import UpdateOne
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 from ..models.contract import (
     ContractData, PartyInfo, AccountInfo, FinancialDetails, 
     LineItem, PaymentTerms, RevenueClassification, SLAInfo, GapAnalysis
@@ -32,6 +50,487 @@ except OSError:
     logger.warning("spaCy model not found. Install with: python -m spacy download en_core_web_sm")
     nlp = None
 
+# Line item patterns, compiled once and paired with their (description, price) group indices.
+# Like the other extraction patterns below, they are matched against the lowercased text.
+_LINE_ITEM_PATTERNS = [
+    r'(\d+)\s*x\s+([^$\n]+?)\s+@\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
+    r'([^$\n]+?)\s+[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)\s*(?:per|each|unit)',
+    r'([^$\n]+?)\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
+    r'(?:item|service|product):\s*([^$\n]+?)\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)'
+]
+_LINE_PATTERNS_WITH_INDICES = tuple(
+    (pattern, (2, 3) if pattern.groups >= 3 else (1, 2))
+    for pattern in (re.compile(p) for p in _LINE_ITEM_PATTERNS)
+    if pattern.groups >= 2
+)
+_COMMA_TABLE = str.maketrans('', '', ',')
+
+# Terms that make a line item description meaningful, matched as substrings in one search
+_MEANINGFUL_TERMS_PATTERN = re.compile('|'.join([
+    'service', 'product', 'license', 'support', 'maintenance', 'consulting',
+    'development', 'training', 'software', 'hardware', 'equipment', 'materials',
+    'labor', 'hour', 'day', 'month', 'year', 'project', 'work', 'deliverable',
+    'implementation', 'installation', 'configuration', 'customization',
+    'integration', 'testing', 'deployment', 'migration', 'upgrade',
+    'subscription', 'hosting', 'cloud', 'saas', 'platform', 'solution'
+]))
+
+# Runs of whitespace and hyphens, collapsed to a single space for detection-only matching
+_SEPARATOR_RUN_PATTERN = re.compile(r'[\s\-]+')
+
+# Contract type keyword phrases, matched as whole words against the normalized text.
+# Each tuple is one detection pattern, listing its alternatives in alternation order;
+# a pattern scores its leftmost non-overlapping hits, as re.findall would count them.
+_CONTRACT_TYPE_KEYWORDS = {
+    'nda': [
+        ('non disclosure agreement', 'nda agreement', 'confidentiality agreement'),
+        ('confidential information', 'proprietary information'),
+        ('disclosing party', 'receiving party'),
+        ('trade secrets', 'confidential data'),
+        ('disclosure obligations', 'non disclosure obligations'),
+        ('confidentiality period', 'term of confidentiality'),
+        ('mutual non disclosure',),
+        ('confidentiality and non disclosure',),
+    ],
+    'employment': [
+        ('employment agreement', 'employee agreement', 'employer agreement'),
+        ('offer letter', 'employment contract'),
+        ('salary package', 'compensation package', 'benefits package'),
+        ('job title', 'position', 'role'),
+        ('start date', 'employment date'),
+        ('at will employment',),
+        ('employment terms and conditions',),
+        ('employee handbook',),
+    ],
+    'service': [
+        ('service agreement', 'consulting agreement', 'professional agreement'),
+        ('statement of work', 'sow'),
+        ('service level', 'sla'),
+        ('service fees', 'hourly rate'),
+        ('service provider', 'vendor', 'supplier'),
+        ('master services agreement', 'master service agreement', 'msa'),
+        ('professional services agreement', 'professional service agreement'),
+        ('consulting services agreement', 'consulting service agreement'),
+    ],
+    'lease': [
+        ('lease agreement', 'rental agreement'),
+        ('lessor', 'lessee'),
+        ('rental payment', 'lease payment'),
+        ('lease term', 'rental period'),
+        ('security deposit',),
+    ],
+    'purchase': [
+        ('purchase agreement', 'sales agreement'),
+        ('buyer', 'seller'),
+        ('purchase price', 'sale price'),
+        ('purchase order', 'po'),
+    ]
+}
+
+# Detection patterns flattened in order, as (category, alternatives)
+_CONTRACT_TYPE_PATTERN_LIST = [
+    (category, alternatives)
+    for category, patterns in _CONTRACT_TYPE_KEYWORDS.items()
+    for alternatives in patterns
+]
+
+
+def _build_keyword_automaton(keywords: Dict[Any, List[str]]):
+    """
+    Build an Aho-Corasick automaton mapping each phrase to its length and categories.
+    
+    Returns None when pyahocorasick is not installed.
+    """
+    if ahocorasick is None:
+        return None
+    
+    categories_by_phrase = {}
+    for category, phrases in keywords.items():
+        for phrase in phrases:
+            categories_by_phrase.setdefault(phrase, []).append(category)
+    
+    automaton = ahocorasick.Automaton()
+    for phrase, categories in categories_by_phrase.items():
+        automaton.add_word(phrase, (len(phrase), tuple(categories)))
+    automaton.make_automaton()
+    return automaton
+
+
+# Each phrase is keyed by its (pattern index, alternative index)
+_CONTRACT_TYPE_AUTOMATON = _build_keyword_automaton({
+    (pattern_index, alternative_index): [phrase]
+    for pattern_index, (_, alternatives) in enumerate(_CONTRACT_TYPE_PATTERN_LIST)
+    for alternative_index, phrase in enumerate(alternatives)
+})
+
+# Regex fallback used when pyahocorasick is not installed, one alternation per pattern
+_CONTRACT_TYPE_PATTERNS = tuple(
+    (category, re.compile(r'\b(?:' + '|'.join(map(re.escape, alternatives)) + r')\b'))
+    for category, alternatives in _CONTRACT_TYPE_PATTERN_LIST
+)
+
+
+def _is_word_char(char: str) -> bool:
+    """Return True for characters that count as word characters for \\b."""
+    return char.isalnum() or char == '_'
+
+
+def _count_contract_type_keywords(text: str) -> Dict[str, int]:
+    """
+    Count whole-word keyword hits per contract type in a single pass over the text.
+    
+    Hits are grouped by pattern and counted the way re.findall counts a pattern's
+    matches: leftmost first, earlier alternatives winning at the same position,
+    and no hit overlapping the one counted before it.
+    """
+    counts = dict.fromkeys(_CONTRACT_TYPE_KEYWORDS, 0)
+    
+    if _CONTRACT_TYPE_AUTOMATON is None:
+        for category, pattern in _CONTRACT_TYPE_PATTERNS:
+            counts[category] += len(pattern.findall(text))
+        return counts
+    
+    hits_by_pattern = [[] for _ in _CONTRACT_TYPE_PATTERN_LIST]
+    text_end = len(text) - 1
+    for end, (length, owners) in _CONTRACT_TYPE_AUTOMATON.iter(text):
+        start = end - length + 1
+        if start > 0 and _is_word_char(text[start - 1]):
+            continue
+        if end < text_end and _is_word_char(text[end + 1]):
+            continue
+        for pattern_index, alternative_index in owners:
+            hits_by_pattern[pattern_index].append((start, alternative_index, end + 1))
+    
+    for (category, _), hits in zip(_CONTRACT_TYPE_PATTERN_LIST, hits_by_pattern):
+        next_start = 0
+        for start, _, stop in sorted(hits):
+            if start >= next_start:
+                counts[category] += 1
+                next_start = stop
+    
+    return counts
+
+
+# Header fields (account numbers, contract IDs, currency) almost always sit near the top
+_HEADER_SCAN_LIMIT = 8192
+
+_CURRENCY_SYMBOLS = '$€£¥₹₽₩₪₦₨₫₭₮₯₰₱₲₳₴₵₶₷₸₺₻₼₾₿'
+
+_ACCOUNT_NUMBER_PATTERNS = tuple(re.compile(p) for p in [
+    r'account\s*(?:number|#|no\.?):\s*([a-z0-9\-]+)',
+    r'acc\s*(?:number|#|no\.?):\s*([a-z0-9\-]+)',
+    r'account:\s*([a-z0-9\-]+)',
+    r'contract\s*(?:id|#|no\.?):\s*([a-z0-9\-]+)',
+    r'contract\s*id:\s*([a-z0-9\-]+)',
+    r'id:\s*([a-z0-9\-]+)',
+])
+
+_BILLING_CONTACT_PATTERNS = tuple(re.compile(p) for p in [
+    r'billing\s+contact:\s*([^\n]+)',
+    r'billing\s+address:\s*([^\n]+)',
+    r'bill\s+to:\s*([^\n]+)',
+    r'contact:\s*([^\n]+)',
+    r'party:\s*([^\n]+)',
+])
+
+# Total contract value patterns
+_AMOUNT_PATTERNS = tuple(re.compile(p) for p in [
+    r'(?:total|contract|agreement)\s+(?:value|amount|price|cost):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
+    r'[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]\s*([\d,]+\.?\d*)\s*(?:per\s+(?:year|month|annum|day))?',
+    r'(?:salary|compensation|payment):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
+    r'(?:annual|monthly|weekly|daily)\s+(?:rate|salary|payment):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
+])
+
+# Party patterns
+_COMPANY_PATTERNS = tuple(re.compile(p) for p in [
+    r'([a-z][a-z]+(?:\s+[a-z][a-z]+)*\s+(?:technologies?|solutions?|systems?|corporation|inc|llc|ltd|pvt\.?\s+ltd|company|co\.?|group|partners?|associates?))',
+    r'(?:company|corporation|llc|inc|ltd|pvt\.?\s+ltd):\s*([^\n,;]+)',
+    r'(?:customer|client|buyer|purchaser):\s*([^\n,;]+)',
+    r'(?:vendor|supplier|seller|provider):\s*([^\n,;]+)',
+    r'(?:party\s+a|first\s+party):\s*([^\n,;]+)',
+    r'(?:party\s+b|second\s+party):\s*([^\n,;]+)',
+])
+
+# Document-level context words used to assign a party type, checked once per document
+_DISCLOSING_CONTEXT_WORDS = ('disclosing party', 'discloser')
+_RECEIVING_CONTEXT_WORDS = ('receiving party', 'recipient')
+_EMPLOYER_CONTEXT_WORDS = ('employer', 'company')
+_EMPLOYEE_CONTEXT_WORDS = ('employee', 'candidate')
+
+# Words in a party's own name that suggest its type, matched as substrings
+_COMPANY_NAME_PATTERN = re.compile(r'technologies|solutions|systems|corporation|inc|llc')
+_CUSTOMER_NAME_PATTERN = re.compile(r'customer|client|buyer')
+_VENDOR_NAME_PATTERN = re.compile(r'vendor|supplier|seller|provider')
+
+# SLA patterns. Gaps never cross a line break, and uptime gaps stop at the next percentage.
+# Number runs and the whitespace after them are possessive: the next token can never
+# start with those characters, so giving any back could not produce a match.
+_UPTIME_PATTERNS = [
+    r'(\d++\.?+\d*+)\s*+%[^%\n]*?(?:uptime|availability|service\s*level)',
+    r'(?:uptime|availability)[^%\n]*?(\d++\.?+\d*+)\s*+%',
+]
+
+_RESPONSE_TIME_PATTERNS = [
+    r'response\s*time[^\n]*?(\d++)\s*+(?:hours?|days?|minutes?)',
+    r'(\d++)\s*+(?:hours?|days?|minutes?)[^\n]*?response\s*time',
+    r'(?:critical|high\s*priority)[^\n]*?(\d++)\s*+(?:hours?|minutes?)[^\n]*?response',
+    r'p[12][^\n]*?(\d++)\s*+(?:hours?|minutes?)',
+]
+
+_SUPPORT_PATTERNS = [
+    r'(24\/7|8\/5|9\/5)\s*support',
+    r'support[^\n]*?(24\/7|8\/5|9\/5)',
+    r'(\d{1,2}:\d{2}\s*(?:am|pm)?\s*-\s*\d{1,2}:\d{2}\s*(?:am|pm)?)',
+    r'(\d++)x(\d++)\s*business\s*hours',
+]
+
+
+def _fuse_patterns(named_patterns: Dict[str, List[str]], flags: int = 0) -> re.Pattern:
+    """
+    Compile pattern lists into a single alternation with one named group per list.
+    
+    A match's lastgroup names the list it came from, so one scan replaces a
+    separate finditer pass per pattern.
+    """
+    return re.compile(
+        '|'.join(f"(?P<{name}>{'|'.join(patterns)})" for name, patterns in named_patterns.items()),
+        flags
+    )
+
+
+_SLA_PATTERN = _fuse_patterns({
+    'uptime': _UPTIME_PATTERNS,
+    'response_time': _RESPONSE_TIME_PATTERNS,
+    'support': _SUPPORT_PATTERNS,
+})
+
+# Documents above this size are scanned for SLA terms with RE2 when google-re2 is installed
+_LARGE_DOCUMENT_THRESHOLD = 50000
+
+
+# RE2's \s and \d are ASCII-only; these classes match what re's \s and \d match on str
+# (e.g. the non-breaking spaces PDF extraction often leaves between words)
+_RE2_UNICODE_CLASSES = {
+    r'\s': r'[\s\x0b\x1c-\x1f\x85\p{Z}]',
+    r'\d': r'\p{Nd}',
+}
+
+
+def _compile_re2(pattern: re.Pattern):
+    """
+    Compile a stdlib pattern with RE2, or return None when google-re2 is not installed.
+    
+    RE2 has no possessive quantifiers, but it never backtracks either, so the
+    possessive suffixes are dropped without changing what the pattern matches.
+    \\s and \\d are widened to their Unicode meaning, which assumes they never
+    appear inside a character class.
+    """
+    if re2 is None:
+        return None
+    source = re.sub(r'(?<=[*+?}])\+', '', pattern.pattern)
+    source = re.sub(r'(?<!\\)\\[sd]', lambda match: _RE2_UNICODE_CLASSES[match.group(0)], source)
+    return re2.compile(source)
+
+
+_SLA_PATTERN_RE2 = _compile_re2(_SLA_PATTERN)
+
+# Payment terms patterns
+_PAYMENT_TERMS_PATTERNS = tuple(re.compile(p) for p in [
+    r'payment\s+terms:\s*([^\n]+)',
+    r'net\s++(\d++)',
+    r'payable\s++within\s++(\d++)\s++days',
+    r'payment\s+frequency:\s*([^\n]+)',
+    r'pay\s+schedule:\s*([^\n]+)',
+])
+
+_PAYMENT_METHOD_PATTERNS = tuple(re.compile(p) for p in [
+    r'payment\s+method:\s*([^\n]+)',
+    r'pay\s+by:\s*([^\n]+)',
+    r'via\s+([^\n]+)',
+    r'through\s+([^\n]+)',
+])
+
+# Revenue classes in priority order as (keywords, payment_type, billing_cycle),
+# matched as substrings of the lowercased text
+_REVENUE_CLASSES = [
+    (['nda', 'non-disclosure', 'non disclosure', 'nondisclosure', 'confidentiality'], 'nda', 'one_time'),
+    (['employment', 'employee', 'employer'], 'employment', 'recurring'),
+    (['monthly', 'subscription', 'recurring'], 'recurring', 'monthly'),
+    (['quarterly'], 'recurring', 'quarterly'),
+    (['annually', 'yearly'], 'recurring', 'annually'),
+]
+_AUTO_RENEWAL_KEYWORDS = ['auto-renewal', 'auto renewal']
+
+_REVENUE_KEYWORDS = {
+    **{priority: keywords for priority, (keywords, _, _) in enumerate(_REVENUE_CLASSES)},
+    'auto_renewal': _AUTO_RENEWAL_KEYWORDS,
+}
+
+_REVENUE_AUTOMATON = _build_keyword_automaton(_REVENUE_KEYWORDS)
+
+# Regex fallback used when pyahocorasick is not installed; group names map back to categories
+_REVENUE_GROUPS = {f'revenue_{category}': category for category in _REVENUE_KEYWORDS}
+_REVENUE_PATTERN = _fuse_patterns({
+    group: [re.escape(keyword) for keyword in _REVENUE_KEYWORDS[category]]
+    for group, category in _REVENUE_GROUPS.items()
+})
+
+
+def _iter_revenue_categories(text: str):
+    """Yield the category of each revenue keyword hit, in text order."""
+    if _REVENUE_AUTOMATON is None:
+        for match in _REVENUE_PATTERN.finditer(text):
+            yield _REVENUE_GROUPS[match.lastgroup]
+    else:
+        for _, (_, categories) in _REVENUE_AUTOMATON.iter(text):
+            yield from categories
+
+
+def _scan_revenue_keywords(text: str) -> Tuple[Optional[int], bool]:
+    """
+    Find the highest-priority revenue class and any auto-renewal mention in one pass.
+    
+    Returns the index into _REVENUE_CLASSES (None if no keyword is present) and
+    whether an auto-renewal keyword appears. The scan stops as soon as an NDA
+    keyword and an auto-renewal keyword have both been seen.
+    """
+    revenue_class = None
+    auto_renewal = False
+    for category in _iter_revenue_categories(text):
+        if category == 'auto_renewal':
+            auto_renewal = True
+        elif revenue_class is None or category < revenue_class:
+            revenue_class = category
+        if revenue_class == 0 and auto_renewal:
+            break
+    
+    return revenue_class, auto_renewal
+
+
+# Contract duration patterns, matched against the lowercased text
+_DURATION_PATTERNS = tuple(re.compile(p) for p in [
+    r'(\d+)\s*(?:years?|months?)\s*from',
+    r'term.*?(\d+)\s*(?:years?|months?)',
+    r'(\d+)\s*(?:years?|months?)\s*contract',
+])
+
+
+def _search_header_first(pattern: re.Pattern, text: str) -> Optional[re.Match]:
+    """
+    Search the document header before falling back to the full text.
+    
+    A header match that runs into the scan limit may have been truncated,
+    so it is re-checked against the full text.
+    """
+    match = pattern.search(text, 0, _HEADER_SCAN_LIMIT)
+    if match and match.end() < _HEADER_SCAN_LIMIT:
+        return match
+    if len(text) <= _HEADER_SCAN_LIMIT:
+        return match
+    return pattern.search(text)
+
+
+# PDFium is not thread-safe, even across separate documents, and text extraction
+# runs in worker threads; all pdfium calls hold this lock
+_PDFIUM_LOCK = threading.Lock()
+
+
+def _join_pages(page_texts) -> str:
+    """
+    Join extracted page texts, each followed by a newline, skipping empty pages.
+    
+    Pages are collected and joined once instead of growing one string per page.
+    """
+    return "".join(f"{page_text}\n" for page_text in page_texts if page_text)
+
+
+def _find_currency_symbol(text: str) -> Optional[str]:
+    """
+    Return the earliest currency symbol in the text, or None.
+    
+    One str.find per symbol is much faster than a character-class regex scan.
+    The header is checked first so the full text is only scanned when it has
+    no symbol.
+    """
+    for end in (_HEADER_SCAN_LIMIT, len(text)):
+        positions = [pos for pos in (text.find(symbol, 0, end) for symbol in _CURRENCY_SYMBOLS) if pos >= 0]
+        if positions:
+            return text[min(positions)]
+    return None
+
+
+# Recommendations added to every non-NDA gap analysis
+_STANDARD_CONTRACT_RECOMMENDATIONS = (
+    "Ensure all financial terms are clearly defined",
+    "Include comprehensive SLA metrics for service contracts",
+)
+
+# Seconds the status writer waits after the first queued update so others can join its batch.
+# This is a fixed delay on every batch, so the awaited 100% and failed updates land this much
+# later than a direct update_one would.
+_STATUS_BATCH_WINDOW = 0.05
+
+
+class _StatusWriter:
+    """
+    Background writer that batches contract status updates from all processors.
+    
+    Updates are queued without blocking extraction. The writer merges queued
+    updates per contract (later fields win) and writes each batch with a single
+    bulk_write, in queue order. Callers that need an update persisted before
+    continuing can await it.
+    """
+    
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self.task = None
+    
+    def enqueue(self, contract_id: str, update_data: Dict[str, Any]) -> asyncio.Future:
+        """Queue an update and return a future resolved once its batch is written."""
+        written = self.loop.create_future()
+        self.queue.put_nowait((contract_id, update_data, written))
+        if self.task is None or self.task.done():
+            self.task = asyncio.create_task(self._run())
+        return written
+    
+    async def _run(self):
+        """Drain the queue in batches until it is empty."""
+        while not self.queue.empty():
+            await asyncio.sleep(_STATUS_BATCH_WINDOW)
+            
+            merged = {}
+            waiters = []
+            while not self.queue.empty():
+                contract_id, update_data, written = self.queue.get_nowait()
+                merged.setdefault(contract_id, {}).update(update_data)
+                waiters.append(written)
+            
+            try:
+                collection = get_collection("contracts")
+                await collection.bulk_write(
+                    [UpdateOne({"contract_id": contract_id}, {"$set": update_data})
+                     for contract_id, update_data in merged.items()],
+                    ordered=False
+                )
+            except Exception as e:
+                logger.error(f"Error updating status for contracts {list(merged)}: {str(e)}")
+            
+            for written in waiters:
+                if not written.done():
+                    written.set_result(None)
+
+
+_status_writer = None
+
+
+def _get_status_writer() -> _StatusWriter:
+    """Return the status writer for the running event loop, creating it if needed."""
+    global _status_writer
+    if _status_writer is None or _status_writer.loop is not asyncio.get_running_loop():
+        _status_writer = _StatusWriter()
+    return _status_writer
+
 
 class ContractProcessor:
     """
@@ -52,125 +551,14 @@ class ContractProcessor:
         Initialize the EnhancedContractProcessor with advanced NLP capabilities.
         """
         self.text_content = ""
+        self._text_lower = ""
+        self._text_norm = ""
+        self._mention_cache = {}
         self.extracted_data = None
         self.contract_type = "unknown"
         self.nlp = nlp
         self.confidence_threshold = 0.6
         
-        # Enhanced pattern libraries
-        self._initialize_pattern_libraries()
-        
-    def _initialize_pattern_libraries(self):
-        """
-        Initialize comprehensive pattern libraries for different extraction tasks.
-        """
-        # Enhanced contract type detection patterns
-        self.contract_type_patterns = {
-            'nda': [
-                r'\b(?:non\s*-\s*disclosure|nda|confidentiality)\s+agreement\b',
-                r'\b(?:confidential|proprietary)\s+information\b',
-                r'\b(?:disclosing\s+party|receiving\s+party)\b',
-                r'\b(?:trade\s+secrets|confidential\s+data)\b',
-                r'\b(?:disclosure|non\s*-\s*disclosure)\s+obligations\b',
-                r'\b(?:confidentiality\s+period|term\s+of\s+confidentiality)\b',
-                r'\b(?:mutual\s+non\s*-\s*disclosure)\b',
-                r'\b(?:confidentiality\s+and\s+non\s*-\s*disclosure)\b'
-            ],
-            'employment': [
-                r'\b(?:employment|employee|employer)\s+agreement\b',
-                r'\b(?:offer\s+letter|employment\s+contract)\b',
-                r'\b(?:salary|compensation|benefits)\s+package\b',
-                r'\b(?:job\s+title|position|role)\b',
-                r'\b(?:start\s+date|employment\s+date)\b',
-                r'\b(?:at\s*-\s*will\s+employment)\b',
-                r'\b(?:employment\s+terms\s+and\s+conditions)\b',
-                r'\b(?:employee\s+handbook)\b'
-            ],
-            'service': [
-                r'\b(?:service|consulting|professional)\s+agreement\b',
-                r'\b(?:statement\s+of\s+work|sow)\b',
-                r'\b(?:service\s+level|sla)\b',
-                r'\b(?:service\s+fees|hourly\s+rate)\b',
-                r'\b(?:service\s+provider|vendor|supplier)\b',
-                r'\b(?:master\s+services?\s+agreement|msa)\b',
-                r'\b(?:professional\s+services?\s+agreement)\b',
-                r'\b(?:consulting\s+services?\s+agreement)\b'
-            ],
-            'lease': [
-                r'\b(?:lease\s+agreement|rental\s+agreement)\b',
-                r'\b(?:lessor|lessee)\b',
-                r'\b(?:rental\s+payment|lease\s+payment)\b',
-                r'\b(?:lease\s+term|rental\s+period)\b',
-                r'\b(?:security\s+deposit)\b'
-            ],
-            'purchase': [
-                r'\b(?:purchase\s+agreement|sales\s+agreement)\b',
-                r'\b(?:buyer|seller)\b',
-                r'\b(?:purchase\s+price|sale\s+price)\b',
-                r'\b(?:purchase\s+order|po)\b'
-            ]
-        }
-        
-        # Enhanced financial patterns
-        self.financial_patterns = {
-            'currency_symbols': r'[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]',
-            'amount_patterns': [
-                r'(?:total|contract|agreement)\s+(?:value|amount|price|cost):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
-                r'[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]\s*([\d,]+\.?\d*)\s*(?:per\s+(?:year|month|annum|day))?',
-                r'(?:salary|compensation|payment):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
-                r'(?:annual|monthly|weekly|daily)\s+(?:rate|salary|payment):\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)'
-            ],
-            'line_item_patterns': [
-                r'(\d+)\s*x\s+([^$\n]+?)\s+@\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
-                r'([^$\n]+?)\s+[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)\s*(?:per|each|unit)',
-                r'([^$\n]+?)\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)',
-                r'(?:item|service|product):\s*([^$\n]+?)\s*[\$€£¥₹₽₩₪₦₨₩₫₭₮₯₰₱₲₳₴₵₶₷₸₹₺₻₼₽₾₿]?\s*([\d,]+\.?\d*)'
-            ]
-        }
-        
-        # Enhanced party patterns
-        self.party_patterns = {
-            'company_patterns': [
-                r'([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Technologies?|Solutions?|Systems?|Corporation|Inc|LLC|Ltd|Pvt\.?\s+Ltd|Company|Co\.?|Group|Partners?|Associates?))',
-                r'(?:company|corporation|llc|inc|ltd|pvt\.?\s+ltd):\s*([^\n,;]+)',
-                r'(?:customer|client|buyer|purchaser):\s*([^\n,;]+)',
-                r'(?:vendor|supplier|seller|provider):\s*([^\n,;]+)',
-                r'(?:party\s+a|first\s+party):\s*([^\n,;]+)',
-                r'(?:party\s+b|second\s+party):\s*([^\n,;]+)'
-            ],
-            'person_patterns': [
-                r'(?:employee|candidate|person):\s*([^\n,;]+)',
-                r'(?:contact\s+person|representative):\s*([^\n,;]+)',
-                r'([A-Z][a-z]+\s+[A-Z][a-z]+)',  # Simple name pattern
-            ]
-        }
-        
-        # Enhanced SLA patterns
-        self.sla_patterns = {
-            'uptime_patterns': [
-                r'(\d+\.?\d*)\s*%.*?uptime',
-                r'uptime.*?(\d+\.?\d*)\s*%',
-                r'(\d+\.?\d*)\s*%.*?availability',
-                r'availability.*?(\d+\.?\d*)\s*%',
-                r'(\d+\.?\d*)\s*%.*?monthly\s*availability',
-                r'(\d+\.?\d*)\s*%.*?service\s*level'
-            ],
-            'response_time_patterns': [
-                r'response\s*time.*?(\d+)\s*(?:hours?|days?|minutes?)',
-                r'(\d+)\s*(?:hours?|days?|minutes?).*?response\s*time',
-                r'critical.*?(\d+)\s*(?:hours?|minutes?).*?response',
-                r'high\s*priority.*?(\d+)\s*(?:hours?|minutes?).*?response',
-                r'p1.*?(\d+)\s*(?:hours?|minutes?)',
-                r'p2.*?(\d+)\s*(?:hours?|minutes?)'
-            ],
-            'support_patterns': [
-                r'(24\/7|8\/5|9\/5)\s*support',
-                r'support.*?(24\/7|8\/5|9\/5)',
-                r'(\d{1,2}:\d{2}\s*(?:am|pm)?\s*-\s*\d{1,2}:\d{2}\s*(?:am|pm)?)',
-                r'(\d+)x(\d+)\s*business\s*hours'
-            ]
-        }
-        
     async def process_contract(self, contract_id: str, file_path: str) -> ContractData:
         """
         Enhanced main processing method with improved extraction capabilities.
@@ -178,38 +566,34 @@ class ContractProcessor:
         try:
             self.extracted_data = ContractData()
             
-            await self._update_status(contract_id, "processing", 10)
+            self._queue_status_update(contract_id, "processing", 10)
             
             # Enhanced text extraction with OCR fallback
             self.text_content = await self._extract_text_enhanced(file_path)
-            await self._update_status(contract_id, "processing", 20)
+            self._prepare_text_views()
+            self._queue_status_update(contract_id, "processing", 20)
             
             # ML-enhanced contract type detection
             self.contract_type = self._detect_contract_type_enhanced()
             logger.info(f"Detected contract type: {self.contract_type}")
-            await self._update_status(contract_id, "processing", 30)
-            
-            # Enhanced extraction methods
-            await self._extract_parties_enhanced()
-            await self._update_status(contract_id, "processing", 50)
-            
-            await self._extract_account_info_enhanced()
-            await self._update_status(contract_id, "processing", 60)
+            self._queue_status_update(contract_id, "processing", 30)
             
+            # The extractors only read the text views and each fill their own
+            # field, so they run concurrently in worker threads off the event loop
+            extractors = [
+                self._extract_parties_enhanced,
+                self._extract_account_info_enhanced,
+                self._extract_payment_terms_enhanced,
+                self._extract_revenue_classification_enhanced,
+                self._extract_sla_info_enhanced,
+            ]
             if self.contract_type != "nda":
-                await self._extract_financial_details_enhanced()
+                extractors.append(self._extract_financial_details_enhanced)
             else:
                 self.extracted_data.financial_details = FinancialDetails(confidence_score=1.0)
-            await self._update_status(contract_id, "processing", 70)
-            
-            await self._extract_payment_terms_enhanced()
-            await self._update_status(contract_id, "processing", 80)
-            
-            await self._extract_revenue_classification_enhanced()
-            await self._update_status(contract_id, "processing", 85)
             
-            await self._extract_sla_info_enhanced()
-            await self._update_status(contract_id, "processing", 90)
+            await asyncio.gather(*(asyncio.to_thread(extractor) for extractor in extractors))
+            self._queue_status_update(contract_id, "processing", 90)
             
             # Enhanced confidence scoring
             self.extracted_data.overall_confidence_score = self._calculate_confidence_score_enhanced()
@@ -229,15 +613,28 @@ class ContractProcessor:
     async def _extract_text_enhanced(self, file_path: str) -> str:
         """
         Enhanced text extraction with multiple methods and OCR fallback.
+        
+        PDF parsing is blocking, so it runs in a worker thread off the event loop.
+        """
+        return await asyncio.to_thread(self._extract_text_sync, file_path)
+    
+    def _extract_text_sync(self, file_path: str) -> str:
+        """
+        Extract text with pypdfium2 when installed, then pdfplumber, then PyPDF2.
         """
         try:
-            # Try pdfplumber first (better text extraction)
+            # Try pdfium first (native text extraction, much faster than the pure Python readers)
+            if pdfium is not None:
+                try:
+                    text = self._extract_text_pdfium(file_path)
+                    if text.strip():
+                        return text
+                except Exception as e:
+                    logger.warning(f"pdfium text extraction failed, falling back: {str(e)}")
+            
+            # Then pdfplumber (better text extraction)
             with pdfplumber.open(file_path) as pdf:
-                text = ""
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
+                text = _join_pages(page.extract_text() for page in pdf.pages)
                 
                 if text.strip():
                     return text
@@ -245,15 +642,63 @@ class ContractProcessor:
             # Fallback to PyPDF2
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
-                text = ""
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-                return text
+                return _join_pages(page.extract_text() for page in pdf_reader.pages)
                 
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             raise
     
+    @staticmethod
+    def _extract_text_pdfium(file_path: str) -> str:
+        """
+        Extract page text with pypdfium2, normalizing pdfium's CRLF line breaks.
+        
+        Runs under _PDFIUM_LOCK, so concurrent uploads extract one at a time.
+        """
+        def page_texts(pdf):
+            for page in pdf:
+                textpage = page.get_textpage()
+                page_text = textpage.get_text_range()
+                textpage.close()
+                page.close()
+                yield page_text.replace('\r\n', '\n')
+        
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(file_path)
+            try:
+                return _join_pages(page_texts(pdf))
+            finally:
+                pdf.close()
+    
+    def _prepare_text_views(self):
+        """
+        Build the lowercased and separator-normalized copies of the document text.
+        
+        The lowercased copy has the same length as the original, so extraction
+        patterns match it without re.IGNORECASE and read captured text back from
+        the original (see _original_text). The normalized copy collapses whitespace
+        and hyphens so detection patterns can be plain phrases.
+        """
+        self._text_lower = self.text_content.lower()
+        if len(self._text_lower) != len(self.text_content):
+            # Keep match offsets valid for the original text (e.g. 'İ' lowercases to two characters)
+            self._text_lower = ''.join(
+                char if len(char.lower()) != 1 else char.lower() for char in self.text_content
+            )
+        self._text_norm = _SEPARATOR_RUN_PATTERN.sub(' ', self._text_lower)
+        self._mention_cache = {}
+    
+    def _original_text(self, match: re.Match, group: int = 0) -> str:
+        """Return the original-case text of a group matched against the lowercased text."""
+        return self.text_content[match.start(group):match.end(group)]
+    
+    def _mentions_any(self, words: Tuple[str, ...]) -> bool:
+        """Return whether the lowercased text contains any of the words, cached per document."""
+        mentioned = self._mention_cache.get(words)
+        if mentioned is None:
+            mentioned = self._mention_cache[words] = any(word in self._text_lower for word in words)
+        return mentioned
+    
     def _detect_contract_type_enhanced(self) -> str:
         """
         Enhanced contract type detection using ML and pattern matching.
@@ -261,16 +706,14 @@ class ContractProcessor:
         if not self.text_content:
             return "unknown"
         
-        text_lower = self.text_content.lower()
+        text_lower = self._text_lower
         
-        # Calculate pattern scores for each contract type
+        # Calculate keyword scores for each contract type
         type_scores = {}
+        keyword_counts = _count_contract_type_keywords(self._text_norm)
         
-        for contract_type, patterns in self.contract_type_patterns.items():
-            score = 0
-            for pattern in patterns:
-                matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-                score += matches * 2  # Weight pattern matches
+        for contract_type, matches in keyword_counts.items():
+            score = matches * 2  # Weight keyword matches
             
             # Additional context scoring
             if contract_type == 'nda':
@@ -293,7 +736,7 @@ class ContractProcessor:
         
         return "unknown"
     
-    async def _extract_parties_enhanced(self):
+    def _extract_parties_enhanced(self):
         """
         Enhanced party extraction using NER and fuzzy matching.
         """
@@ -317,10 +760,9 @@ class ContractProcessor:
                         parties.append(party)
         
         # Enhanced pattern matching
-        for pattern in self.party_patterns['company_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
-                party_name = match.group(1).strip()
+        for pattern in _COMPANY_PATTERNS:
+            for match in pattern.finditer(self._text_lower):
+                party_name = self._original_text(match, 1).strip()
                 if len(party_name) > 3 and len(party_name) < 200:
                     party_type = self._determine_party_type_enhanced(party_name, 'ORG')
                     party = PartyInfo(
@@ -338,7 +780,6 @@ class ContractProcessor:
         """
         Enhanced party type determination using context and entity type.
         """
-        text_lower = self.text_content.lower()
         party_lower = party_name.lower()
         
         if self.contract_type == "nda":
@@ -349,13 +790,13 @@ class ContractProcessor:
                 return 'disclosing_party'
             
             # Context-based detection
-            if any(word in text_lower for word in ['disclosing party', 'discloser']):
+            if self._mentions_any(_DISCLOSING_CONTEXT_WORDS):
                 return 'disclosing_party'
-            elif any(word in text_lower for word in ['receiving party', 'recipient']):
+            elif self._mentions_any(_RECEIVING_CONTEXT_WORDS):
                 return 'receiving_party'
             
             # Company pattern detection
-            if any(word in party_lower for word in ['technologies', 'solutions', 'systems', 'corporation', 'inc', 'llc']):
+            if _COMPANY_NAME_PATTERN.search(party_lower):
                 return 'disclosing_party'
             else:
                 return 'receiving_party'
@@ -366,15 +807,15 @@ class ContractProcessor:
             elif entity_type == 'ORG':
                 return 'employer'
             
-            if any(word in text_lower for word in ['employer', 'company']):
+            if self._mentions_any(_EMPLOYER_CONTEXT_WORDS):
                 return 'employer'
-            elif any(word in text_lower for word in ['employee', 'candidate']):
+            elif self._mentions_any(_EMPLOYEE_CONTEXT_WORDS):
                 return 'employee'
         
         # General contract types
-        if any(word in party_lower for word in ['customer', 'client', 'buyer']):
+        if _CUSTOMER_NAME_PATTERN.search(party_lower):
             return 'customer'
-        elif any(word in party_lower for word in ['vendor', 'supplier', 'seller', 'provider']):
+        elif _VENDOR_NAME_PATTERN.search(party_lower):
             return 'vendor'
         else:
             return 'third_party'
@@ -385,32 +826,42 @@ class ContractProcessor:
         """
         if not parties:
             return []
-        
-        unique_parties = [parties[0]]
-        
-        for party in parties[1:]:
+
+        # Collapse exact duplicates in one pass, keyed by lowercased name. An
+        # identical name always scores 100 against its first occurrence, so this
+        # keeps exactly the parties the fuzzy pass alone would keep.
+        candidates = {}
+        for party in parties:
+            key = party.name.lower()
+            if key not in candidates:
+                candidates[key] = party
+
+        unique_parties = []
+        unique_names = []
+
+        for name, party in candidates.items():
             is_duplicate = False
-            for existing_party in unique_parties:
-                similarity = fuzz.ratio(party.name.lower(), existing_party.name.lower())
+            for existing_name in unique_names:
+                similarity = fuzz.ratio(name, existing_name)
                 if similarity > 85:  # 85% similarity threshold
                     is_duplicate = True
                     break
-            
+
             if not is_duplicate:
                 unique_parties.append(party)
-        
+                unique_names.append(name)
+
         return unique_parties
     
-    async def _extract_financial_details_enhanced(self):
+    def _extract_financial_details_enhanced(self):
         """
         Enhanced financial details extraction with better currency detection.
         """
         financial_details = FinancialDetails(confidence_score=0.0)
         
         # Enhanced amount extraction
-        for pattern in self.financial_patterns['amount_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
+        for pattern in _AMOUNT_PATTERNS:
+            for match in pattern.finditer(self._text_lower):
                 amount_str = match.group(1).replace(',', '')
                 try:
                     amount = float(amount_str)
@@ -422,9 +873,9 @@ class ContractProcessor:
                     continue
         
         # Enhanced currency detection
-        currency_match = re.search(self.financial_patterns['currency_symbols'], self.text_content)
-        if currency_match:
-            financial_details.currency = currency_match.group(0)
+        currency = _find_currency_symbol(self.text_content)
+        if currency:
+            financial_details.currency = currency
         
         # Enhanced line items extraction
         line_items = self._extract_line_items_enhanced()
@@ -441,27 +892,28 @@ class ContractProcessor:
         if self.contract_type == "nda":
             return line_items
         
-        for pattern in self.financial_patterns['line_item_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
-                if len(match.groups()) >= 2:
-                    description = match.group(2) if len(match.groups()) >= 3 else match.group(1)
-                    price_str = match.group(3) if len(match.groups()) >= 3 else match.group(2)
-                    
-                    if self._is_valid_line_item_description_enhanced(description):
-                        try:
-                            price = float(price_str.replace(',', ''))
-                            if price > 0:
-                                line_item = LineItem(
-                                    description=description.strip(),
-                                    unit_price=price,
-                                    confidence_score=0.8
-                                )
-                                line_items.append(line_item)
-                        except ValueError:
-                            continue
-        
-        return line_items[:10]
+        for pattern, (desc_idx, price_idx) in _LINE_PATTERNS_WITH_INDICES:
+            for match in pattern.finditer(self._text_lower):
+                description = self._original_text(match, desc_idx)
+                price_str = match.group(price_idx)
+                
+                if self._is_valid_line_item_description_enhanced(description):
+                    try:
+                        price = float(price_str.translate(_COMMA_TABLE))
+                        if price > 0:
+                            line_item = LineItem(
+                                description=description.strip(),
+                                unit_price=price,
+                                confidence_score=0.8
+                            )
+                            line_items.append(line_item)
+                            # Only the first ten items are kept, so stop scanning once they are found
+                            if len(line_items) == 10:
+                                return line_items
+                    except ValueError:
+                        continue
+        
+        return line_items
     
     def _is_valid_line_item_description_enhanced(self, description: str) -> bool:
         """
@@ -472,49 +924,29 @@ class ContractProcessor:
         if len(description_lower) < 5:
             return False
         
-        # Enhanced meaningful terms
-        meaningful_terms = [
-            'service', 'product', 'license', 'support', 'maintenance', 'consulting',
-            'development', 'training', 'software', 'hardware', 'equipment', 'materials',
-            'labor', 'hour', 'day', 'month', 'year', 'project', 'work', 'deliverable',
-            'implementation', 'installation', 'configuration', 'customization',
-            'integration', 'testing', 'deployment', 'migration', 'upgrade',
-            'subscription', 'hosting', 'cloud', 'saas', 'platform', 'solution'
-        ]
-        
-        return any(term in description_lower for term in meaningful_terms)
+        return _MEANINGFUL_TERMS_PATTERN.search(description_lower) is not None
     
-    async def _extract_sla_info_enhanced(self):
+    def _extract_sla_info_enhanced(self):
         """
         Enhanced SLA information extraction with better pattern matching.
         """
         sla_info = SLAInfo(confidence_score=0.0)
         
-        # Enhanced uptime extraction
-        for pattern in self.sla_patterns['uptime_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
-                full_match = match.group(0)
-                if full_match not in sla_info.performance_metrics:
-                    sla_info.performance_metrics.append(full_match)
-        
-        # Enhanced response time extraction
-        for pattern in self.sla_patterns['response_time_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
-                full_match = match.group(0)
-                if full_match not in sla_info.performance_metrics:
-                    sla_info.performance_metrics.append(full_match)
-        
-        # Enhanced support terms extraction
-        for pattern in self.sla_patterns['support_patterns']:
-            matches = re.finditer(pattern, self.text_content, re.IGNORECASE)
-            for match in matches:
-                support_text = match.group(0)
-                if not sla_info.support_terms:
-                    sla_info.support_terms = support_text
-                elif support_text not in sla_info.support_terms:
-                    sla_info.support_terms += f"; {support_text}"
+        metrics, support_parts = [], []
+        
+        # Uptime, response time and support terms in a single scan
+        sla_pattern = _SLA_PATTERN
+        if _SLA_PATTERN_RE2 is not None and len(self._text_lower) > _LARGE_DOCUMENT_THRESHOLD:
+            sla_pattern = _SLA_PATTERN_RE2
+        
+        for match in sla_pattern.finditer(self._text_lower):
+            parts = support_parts if match.lastgroup == 'support' else metrics
+            parts.append(self._original_text(match))
+        
+        # Order-preserving dedup once at the end instead of a membership test per match
+        sla_info.performance_metrics = list(dict.fromkeys(metrics))
+        if support_parts:
+            sla_info.support_terms = "; ".join(dict.fromkeys(support_parts))
         
         # Calculate enhanced confidence score
         confidence_score = 0.0
@@ -530,69 +962,47 @@ class ContractProcessor:
         sla_info.confidence_score = confidence_score
         self.extracted_data.sla_info = sla_info
     
-    def _calculate_confidence_score_enhanced(self) -> float:
+    def _calculate_confidence_score_enhanced(self) -> int:
         """
         Enhanced confidence score calculation with multiple validation layers.
         """
-        scores = []
-        
-        # Enhanced financial completeness (30 points)
-        if self.extracted_data.financial_details.total_contract_value:
-            scores.append(30)
-        elif self.extracted_data.financial_details.line_items:
-            scores.append(25)
-        else:
-            scores.append(0)
-        
-        # Enhanced party identification (25 points)
-        if self.extracted_data.parties:
-            # Bonus for multiple parties
-            party_score = min(25, len(self.extracted_data.parties) * 8)
-            scores.append(party_score)
-        else:
-            scores.append(0)
-        
-        # Enhanced payment terms (20 points)
-        if self.extracted_data.payment_terms.payment_terms:
-            scores.append(20)
-        else:
-            scores.append(0)
-        
-        # Enhanced SLA definition (15 points)
-        if (self.extracted_data.sla_info.performance_metrics or 
-            self.extracted_data.sla_info.support_terms):
-            scores.append(15)
-        else:
-            scores.append(0)
-        
-        # Enhanced contact information (10 points)
-        if (self.extracted_data.account_info.billing_contact or 
-            self.extracted_data.account_info.account_number):
-            scores.append(10)
-        else:
-            scores.append(0)
+        data = self.extracted_data
+        financial = data.financial_details
         
-        return sum(scores)
+        return (
+            # Enhanced financial completeness (30 points, 25 for line items only)
+            30 * bool(financial.total_contract_value)
+            + 25 * (not financial.total_contract_value and bool(financial.line_items))
+            # Enhanced party identification (25 points, 8 per party)
+            + min(25, len(data.parties) * 8)
+            # Enhanced payment terms (20 points)
+            + 20 * bool(data.payment_terms.payment_terms)
+            # Enhanced SLA definition (15 points)
+            + 15 * bool(data.sla_info.performance_metrics or data.sla_info.support_terms)
+            # Enhanced contact information (10 points)
+            + 10 * bool(data.account_info.billing_contact or data.account_info.account_number)
+        )
     
     def _perform_gap_analysis_enhanced(self) -> GapAnalysis:
         """
         Enhanced gap analysis with more detailed recommendations.
         """
         gaps = GapAnalysis()
+        data = self.extracted_data
         
         if self.contract_type == "nda":
             # Enhanced NDA gap analysis
-            if not self.extracted_data.parties:
+            if not data.parties:
                 gaps.critical_gaps.append("No disclosing or receiving party information found")
             else:
-                party_types = [party.type for party in self.extracted_data.parties]
+                party_types = {party.type for party in data.parties}
                 if 'disclosing_party' not in party_types:
                     gaps.missing_fields.append("Disclosing party not clearly identified")
                 if 'receiving_party' not in party_types:
                     gaps.missing_fields.append("Receiving party not clearly identified")
             
             # Enhanced NDA-specific recommendations
-            text_lower = self.text_content.lower()
+            text_lower = self._text_lower
             if 'confidentiality period' not in text_lower:
                 gaps.missing_fields.append("Confidentiality period not clearly defined")
             
@@ -603,20 +1013,21 @@ class ContractProcessor:
             
         else:
             # Enhanced standard contract gap analysis
-            if not self.extracted_data.parties:
+            if not data.parties:
                 gaps.critical_gaps.append("No party information found")
             
-            if not self.extracted_data.financial_details.total_contract_value:
+            if not data.financial_details.total_contract_value:
                 gaps.critical_gaps.append("No total contract value found")
             
-            if not self.extracted_data.payment_terms.payment_terms:
+            if not data.payment_terms.payment_terms:
                 gaps.critical_gaps.append("No payment terms found")
             
             # Enhanced SLA gap analysis
-            if not self.extracted_data.sla_info.performance_metrics:
+            sla_info = data.sla_info
+            if not sla_info.performance_metrics:
                 gaps.missing_fields.append("SLA performance metrics (uptime, response time, availability)")
             
-            if not self.extracted_data.sla_info.support_terms:
+            if not sla_info.support_terms:
                 gaps.missing_fields.append("Support hours and terms")
             
             # Enhanced recommendations
@@ -626,51 +1037,33 @@ class ContractProcessor:
             if len(gaps.missing_fields) > 3:
                 gaps.recommendations.append("Consider template-based contract structure")
             
-            gaps.recommendations.append("Ensure all financial terms are clearly defined")
-            gaps.recommendations.append("Include comprehensive SLA metrics for service contracts")
+            gaps.recommendations.extend(_STANDARD_CONTRACT_RECOMMENDATIONS)
         
         return gaps
     
-    async def _extract_account_info_enhanced(self):
+    def _extract_account_info_enhanced(self):
         """Enhanced account information extraction."""
         account_info = AccountInfo(confidence_score=0.0)
         
         # Enhanced account number patterns
-        account_patterns = [
-            r'account\s*(?:number|#|no\.?):\s*([A-Z0-9\-]+)',
-            r'acc\s*(?:number|#|no\.?):\s*([A-Z0-9\-]+)',
-            r'account:\s*([A-Z0-9\-]+)',
-            r'contract\s*(?:id|#|no\.?):\s*([A-Z0-9\-]+)',
-            r'contract\s*id:\s*([A-Z0-9\-]+)',
-            r'id:\s*([A-Z0-9\-]+)',
-        ]
-        
-        for pattern in account_patterns:
-            match = re.search(pattern, self.text_content, re.IGNORECASE)
+        for pattern in _ACCOUNT_NUMBER_PATTERNS:
+            match = _search_header_first(pattern, self._text_lower)
             if match:
-                account_info.account_number = match.group(1)
+                account_info.account_number = self._original_text(match, 1)
                 account_info.confidence_score = 0.8
                 break
         
         # Enhanced billing contact patterns
-        billing_patterns = [
-            r'billing\s+contact:\s*([^\n]+)',
-            r'billing\s+address:\s*([^\n]+)',
-            r'bill\s+to:\s*([^\n]+)',
-            r'contact:\s*([^\n]+)',
-            r'party:\s*([^\n]+)',
-        ]
-        
-        for pattern in billing_patterns:
-            match = re.search(pattern, self.text_content, re.IGNORECASE)
+        for pattern in _BILLING_CONTACT_PATTERNS:
+            match = _search_header_first(pattern, self._text_lower)
             if match:
-                account_info.billing_contact = match.group(1).strip()
+                account_info.billing_contact = self._original_text(match, 1).strip()
                 account_info.confidence_score = 0.7
                 break
         
         self.extracted_data.account_info = account_info
     
-    async def _extract_payment_terms_enhanced(self):
+    def _extract_payment_terms_enhanced(self):
         """Enhanced payment terms extraction."""
         payment_terms = PaymentTerms(confidence_score=0.0)
         
@@ -680,75 +1073,41 @@ class ContractProcessor:
             payment_terms.payment_method = "Not applicable"
         else:
             # Enhanced payment terms patterns
-            terms_patterns = [
-                r'payment\s+terms:\s*([^\n]+)',
-                r'net\s+(\d+)',
-                r'payable\s+within\s+(\d+)\s+days',
-                r'payment\s+frequency:\s*([^\n]+)',
-                r'pay\s+schedule:\s*([^\n]+)',
-            ]
-            
-            for pattern in terms_patterns:
-                match = re.search(pattern, self.text_content, re.IGNORECASE)
+            for pattern in _PAYMENT_TERMS_PATTERNS:
+                match = pattern.search(self._text_lower)
                 if match:
-                    payment_terms.payment_terms = match.group(0)
+                    payment_terms.payment_terms = self._original_text(match)
                     payment_terms.confidence_score = 0.8
                     break
             
             # Enhanced payment method patterns
-            method_patterns = [
-                r'payment\s+method:\s*([^\n]+)',
-                r'pay\s+by:\s*([^\n]+)',
-                r'via\s+([^\n]+)',
-                r'through\s+([^\n]+)',
-            ]
-            
-            for pattern in method_patterns:
-                match = re.search(pattern, self.text_content, re.IGNORECASE)
+            for pattern in _PAYMENT_METHOD_PATTERNS:
+                match = pattern.search(self._text_lower)
                 if match:
-                    payment_terms.payment_method = match.group(1).strip()
+                    payment_terms.payment_method = self._original_text(match, 1).strip()
                     break
         
         self.extracted_data.payment_terms = payment_terms
     
-    async def _extract_revenue_classification_enhanced(self):
+    def _extract_revenue_classification_enhanced(self):
         """Enhanced revenue classification extraction."""
         revenue = RevenueClassification(confidence_score=0.0)
         
-        text_lower = self.text_content.lower()
-        
-        # Enhanced payment type detection
-        if any(word in text_lower for word in ['nda', 'non.?disclosure', 'confidentiality']):
-            revenue.payment_type = 'nda'
-            revenue.billing_cycle = 'one_time'
-        elif any(word in text_lower for word in ['employment', 'employee', 'employer']):
-            revenue.payment_type = 'employment'
-            revenue.billing_cycle = 'recurring'
-        elif any(word in text_lower for word in ['monthly', 'subscription', 'recurring']):
-            revenue.payment_type = 'recurring'
-            revenue.billing_cycle = 'monthly'
-        elif any(word in text_lower for word in ['quarterly']):
-            revenue.payment_type = 'recurring'
-            revenue.billing_cycle = 'quarterly'
-        elif any(word in text_lower for word in ['annually', 'yearly']):
-            revenue.payment_type = 'recurring'
-            revenue.billing_cycle = 'annually'
+        text_lower = self._text_lower
+        
+        # Payment type and auto-renewal detection in a single keyword scan
+        revenue_class, auto_renewal = _scan_revenue_keywords(text_lower)
+        if revenue_class is not None:
+            _, revenue.payment_type, revenue.billing_cycle = _REVENUE_CLASSES[revenue_class]
         else:
             revenue.payment_type = 'one_time'
         
-        # Enhanced auto-renewal detection
-        if 'auto-renewal' in text_lower or 'auto renewal' in text_lower:
+        if auto_renewal:
             revenue.auto_renewal = True
         
         # Enhanced contract duration detection
-        duration_patterns = [
-            r'(\d+)\s*(?:years?|months?)\s*from',
-            r'term.*?(\d+)\s*(?:years?|months?)',
-            r'(\d+)\s*(?:years?|months?)\s*contract',
-        ]
-        
-        for pattern in duration_patterns:
-            match = re.search(pattern, text_lower)
+        for pattern in _DURATION_PATTERNS:
+            match = pattern.search(text_lower)
             if match:
                 try:
                     revenue.contract_duration = str(match.group(1))
@@ -759,30 +1118,30 @@ class ContractProcessor:
         revenue.confidence_score = 0.7
         self.extracted_data.revenue_classification = revenue
     
+    def _build_status_update(self, status: str, progress: float, error_message: str = None) -> Dict[str, Any]:
+        """Build the $set document for a status update."""
+        now = datetime.utcnow()
+        update_data = {
+            "status": status,
+            "progress_percentage": progress,
+            "updated_at": now
+        }
+        
+        if status == "processing" and progress == 10:
+            update_data["processing_started_at"] = now
+        elif status in ["completed", "failed"]:
+            update_data["processing_completed_at"] = now
+        
+        if error_message:
+            update_data["error_message"] = error_message
+        
+        return update_data
+    
+    def _queue_status_update(self, contract_id: str, status: str, progress: float):
+        """Queue an intermediate progress update without waiting for it to be written."""
+        _get_status_writer().enqueue(contract_id, self._build_status_update(status, progress))
+    
     async def _update_status(self, contract_id: str, status: str, progress: float, error_message: str = None):
-        """Update contract processing status in the database."""
-        try:
-            collection = get_collection("contracts")
-            update_data = {
-                "status": status,
-                "progress_percentage": progress,
-                "updated_at": datetime.utcnow()
-            }
-            
-            if status == "processing" and progress == 10:
-                update_data["processing_started_at"] = datetime.utcnow()
-            elif status in ["completed", "failed"]:
-                update_data["processing_completed_at"] = datetime.utcnow()
-            
-            if error_message:
-                update_data["error_message"] = error_message
-            
-            await collection.update_one(
-                {"contract_id": contract_id},
-                {"$set": update_data}
-            )
-        except Exception as e:
-            logger.error(f"Error updating status for contract {contract_id}: {str(e)}")
-
-
-
+        """Update contract processing status in the database, after any queued updates."""
+        update_data = self._build_status_update(status, progress, error_message)
+        await _get_status_writer().enqueue(contract_id, update_data)
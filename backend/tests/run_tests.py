@@ -12,21 +12,16 @@ def run_tests():
     """Run all tests with coverage."""
     print("Running Contract Intelligence Parser tests...")
     
-    # Run tests with coverage
+    # Run tests with coverage, streaming pytest output straight to the console
     result = subprocess.run([
-        "python", "-m", "pytest", 
+        sys.executable, "-m", "pytest", 
         "tests/", 
         "--cov=app", 
         "--cov-report=term-missing", 
         "--cov-report=html:htmlcov",
         "--cov-fail-under=60",
         "-v"
-    ], capture_output=True, text=True)
-    
-    print(result.stdout)
-    
-    if result.stderr:
-        print("Errors:", result.stderr)
+    ])
     
     return result.returncode == 0
 
@@ -0,0 +1,135 @@
+"""
+Tests for contract type keyword counting.
+
+Both backends (Aho-Corasick and the regex fallback) must produce the same
+per-type counts as running each original detection pattern with re.findall.
+"""
+
+import random
+import re
+
+import pytest
+
+from app.services import contract_processor
+from app.services.contract_processor import _SEPARATOR_RUN_PATTERN, _count_contract_type_keywords
+
+# The detection patterns as originally written, run against the normalized text
+BASELINE_PATTERNS = {
+    'nda': [
+        r'\b(?:non disclosure|nda|confidentiality) agreement\b',
+        r'\b(?:confidential|proprietary) information\b',
+        r'\b(?:disclosing party|receiving party)\b',
+        r'\b(?:trade secrets|confidential data)\b',
+        r'\b(?:disclosure|non disclosure) obligations\b',
+        r'\b(?:confidentiality period|term of confidentiality)\b',
+        r'\b(?:mutual non disclosure)\b',
+        r'\b(?:confidentiality and non disclosure)\b'
+    ],
+    'employment': [
+        r'\b(?:employment|employee|employer) agreement\b',
+        r'\b(?:offer letter|employment contract)\b',
+        r'\b(?:salary|compensation|benefits) package\b',
+        r'\b(?:job title|position|role)\b',
+        r'\b(?:start date|employment date)\b',
+        r'\b(?:at will employment)\b',
+        r'\b(?:employment terms and conditions)\b',
+        r'\b(?:employee handbook)\b'
+    ],
+    'service': [
+        r'\b(?:service|consulting|professional) agreement\b',
+        r'\b(?:statement of work|sow)\b',
+        r'\b(?:service level|sla)\b',
+        r'\b(?:service fees|hourly rate)\b',
+        r'\b(?:service provider|vendor|supplier)\b',
+        r'\b(?:master services? agreement|msa)\b',
+        r'\b(?:professional services? agreement)\b',
+        r'\b(?:consulting services? agreement)\b'
+    ],
+    'lease': [
+        r'\b(?:lease agreement|rental agreement)\b',
+        r'\b(?:lessor|lessee)\b',
+        r'\b(?:rental payment|lease payment)\b',
+        r'\b(?:lease term|rental period)\b',
+        r'\b(?:security deposit)\b'
+    ],
+    'purchase': [
+        r'\b(?:purchase agreement|sales agreement)\b',
+        r'\b(?:buyer|seller)\b',
+        r'\b(?:purchase price|sale price)\b',
+        r'\b(?:purchase order|po)\b'
+    ]
+}
+
+FRAGMENTS = [
+    'non-disclosure', 'non disclosure', 'disclosure', 'obligations', 'agreement', 'mutual',
+    'confidentiality', 'and', 'period', 'nda', 'confidential information', 'proprietary',
+    'employment', 'employee', 'handbook', 'at-will', 'will', 'job title', 'role', 'position',
+    'master', 'services', 'service', 'level', 'sla', 'msa', 'sow', 'vendor', 'consulting',
+    'professional', 'lease', 'rental', 'payment', 'lessor', 'buyer', 'seller', 'purchase',
+    'order', 'po', 'price', 'the', 'x', '-', '\n',
+]
+
+
+def baseline_counts(text):
+    normalized = _SEPARATOR_RUN_PATTERN.sub(' ', text.lower())
+    return {
+        category: sum(len(re.findall(pattern, normalized)) for pattern in patterns)
+        for category, patterns in BASELINE_PATTERNS.items()
+    }
+
+
+def keyword_counts(text):
+    return _count_contract_type_keywords(_SEPARATOR_RUN_PATTERN.sub(' ', text.lower()))
+
+
+CURATED_TEXTS = [
+    'Mutual Non-Disclosure Agreement',
+    'non disclosure obligations apply',
+    'buyer master services agreement purchase order non-disclosure obligations buyer',
+    'confidentiality and non-disclosure agreement',
+    'SERVICE AGREEMENT\nP1 incidents are fixed within 2 hours.',
+    '',
+]
+
+
+def random_texts(count=500):
+    rng = random.Random(1234)
+    for _ in range(count):
+        yield ' '.join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 30)))
+
+
+def first_mismatch(texts):
+    for text in texts:
+        actual, expected = keyword_counts(text), baseline_counts(text)
+        if actual != expected:
+            return text, actual, expected
+    return None
+
+
+@pytest.fixture
+def regex_fallback(monkeypatch):
+    monkeypatch.setattr(contract_processor, '_CONTRACT_TYPE_AUTOMATON', None)
+
+
+@pytest.fixture
+def automaton():
+    if contract_processor._CONTRACT_TYPE_AUTOMATON is None:
+        pytest.skip('pyahocorasick is not installed')
+
+
+@pytest.mark.parametrize('text', CURATED_TEXTS)
+def test_regex_fallback_matches_baseline(regex_fallback, text):
+    assert keyword_counts(text) == baseline_counts(text)
+
+
+@pytest.mark.parametrize('text', CURATED_TEXTS)
+def test_automaton_matches_baseline(automaton, text):
+    assert keyword_counts(text) == baseline_counts(text)
+
+
+def test_regex_fallback_matches_baseline_on_random_texts(regex_fallback):
+    assert first_mismatch(random_texts()) is None
+
+
+def test_automaton_matches_baseline_on_random_texts(automaton):
+    assert first_mismatch(random_texts()) is None
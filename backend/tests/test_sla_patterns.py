@@ -0,0 +1,100 @@
+"""
+Tests for the SLA and contract duration patterns.
+
+The RE2 build of the fused SLA pattern must find the same matches as the
+stdlib pattern it is compiled from.
+"""
+
+import random
+
+import pytest
+
+from app.services.contract_processor import _DURATION_PATTERNS, _SLA_PATTERN, _SLA_PATTERN_RE2
+
+# Clauses as they appear in real contracts, with the value each one should yield
+SLA_CLAUSES = [
+    ('Availability of the hosted services, measured on a calendar month basis, '
+     'shall be at least 99.9%.', 'uptime', '99.9%'),
+    ('The Provider guarantees 99.95% of scheduled hours, excluding planned maintenance '
+     'windows announced in advance, as monthly availability.', 'uptime', '99.95%'),
+    ('Response time for Severity 1 (critical) incidents shall be no more than 4 hours.',
+     'response_time', '4 hours'),
+    ('Critical incidents reported through the customer portal or by telephone will '
+     'receive a 30 minute initial response.', 'response_time', '30 minute'),
+    ('P1 issues affecting all users of the production environment shall be resolved '
+     'within 2 hours.', 'response_time', '2 hours'),
+    ('Support for the Licensed Software, including access to the help desk and '
+     'knowledge base, is provided 24/7.', 'support', '24/7'),
+]
+
+# Texts with Unicode whitespace and digits, which RE2's own \s and \d would miss
+UNICODE_TEXTS = [
+    'uptime of 99.9\xa0%',
+    'response\xa0time within 4 hours',
+    'support hours 9:00 am - 5:00 pm, 8x5\xa0business hours',
+    'p1 incidents ٤ hours',
+]
+
+FRAGMENTS = [
+    'uptime', 'availability', 'service level', 'of', 'response', 'time', 'within',
+    'critical', 'high priority', 'p1', 'p2', 'support', '24/7', '8/5', 'business hours',
+    '99.9', '99.5', '4', '30', '%', 'hours', 'minutes', 'days', '9:00', '17:00', 'am', 'pm',
+    '-', '8x5', '٤', '.', '\n',
+]
+SEPARATORS = [' ', ' ', '', '\xa0', ' ', '　', '\t', '\x0b', '\x85']
+
+
+def random_texts(count=500):
+    rng = random.Random(4321)
+    for _ in range(count):
+        yield ''.join(
+            rng.choice(FRAGMENTS) + rng.choice(SEPARATORS) for _ in range(rng.randint(1, 25))
+        )
+
+
+def match_spans(pattern, text):
+    return [(m.lastgroup, m.span()) for m in pattern.finditer(text)]
+
+
+def first_mismatch(pattern, texts):
+    for text in texts:
+        actual, expected = match_spans(pattern, text), match_spans(_SLA_PATTERN, text)
+        if actual != expected:
+            return text, actual, expected
+    return None
+
+
+@pytest.fixture
+def re2_pattern():
+    if _SLA_PATTERN_RE2 is None:
+        pytest.skip('google-re2 is not installed')
+    return _SLA_PATTERN_RE2
+
+
+@pytest.mark.parametrize('clause, kind, value', SLA_CLAUSES)
+def test_sla_pattern_matches_realistic_clauses(clause, kind, value):
+    match = _SLA_PATTERN.search(clause.lower())
+    assert match is not None
+    assert match.lastgroup == kind
+    assert value in match.group(0)
+
+
+def test_sla_gaps_stop_at_line_breaks():
+    assert _SLA_PATTERN.search('availability\n99.9%') is None
+    assert _SLA_PATTERN.search('response time\n4 hours') is None
+
+
+def test_duration_pattern_matches_long_term_clause():
+    clause = ('The term of this Agreement shall commence on the Effective Date and '
+              'continue for 3 years.')
+    match = next(filter(None, (p.search(clause.lower()) for p in _DURATION_PATTERNS)))
+    assert match.group(1) == '3'
+
+
+@pytest.mark.parametrize('text', [clause.lower() for clause, _, _ in SLA_CLAUSES] + UNICODE_TEXTS)
+def test_re2_pattern_matches_stdlib(re2_pattern, text):
+    assert match_spans(re2_pattern, text) == match_spans(_SLA_PATTERN, text)
+
+
+def test_re2_pattern_matches_stdlib_on_random_texts(re2_pattern):
+    assert first_mismatch(re2_pattern, random_texts()) is None
@@ -0,0 +1,98 @@
+"""
+Tests for the batched contract status writer.
+"""
+
+import asyncio
+
+import pytest
+from pymongo import UpdateOne
+
+from app.services import contract_processor
+from app.services.contract_processor import ContractProcessor, _get_status_writer
+
+
+class FakeCollection:
+    """Records bulk_write calls; a write blocks until `release` is set."""
+
+    def __init__(self, error=None):
+        self.calls = []
+        self.finished = []
+        self.release = asyncio.Event()
+        self.release.set()
+        self.error = error
+
+    async def bulk_write(self, operations, ordered=True):
+        self.calls.append((operations, ordered))
+        await self.release.wait()
+        self.finished.append(operations)
+        if self.error:
+            raise self.error
+
+
+@pytest.fixture
+def collection(monkeypatch):
+    fake = FakeCollection()
+    monkeypatch.setattr(contract_processor, 'get_collection', lambda name: fake)
+    monkeypatch.setattr(contract_processor, '_status_writer', None)
+    monkeypatch.setattr(contract_processor, '_STATUS_BATCH_WINDOW', 0)
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_updates_for_one_contract_are_merged_in_queue_order(collection):
+    writer = _get_status_writer()
+    writer.enqueue('c1', {'status': 'processing', 'progress': 10})
+    writer.enqueue('c2', {'status': 'processing', 'progress': 10})
+    writer.enqueue('c1', {'progress': 20, 'updated_at': 'later'})
+    await asyncio.wait_for(writer.enqueue('c1', {'progress': 30}), 1)
+
+    assert collection.calls == [([
+        UpdateOne({'contract_id': 'c1'},
+                  {'$set': {'status': 'processing', 'progress': 30, 'updated_at': 'later'}}),
+        UpdateOne({'contract_id': 'c2'}, {'$set': {'status': 'processing', 'progress': 10}}),
+    ], False)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('status, progress', [('processing', 100), ('failed', 0)])
+async def test_terminal_update_resolves_after_its_bulk_write(collection, status, progress):
+    processor = ContractProcessor()
+    collection.release.clear()
+    processor._queue_status_update('c1', 'processing', 90)
+    update = asyncio.create_task(processor._update_status('c1', status, progress))
+
+    while not collection.calls:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert not update.done()
+
+    collection.release.set()
+    await asyncio.wait_for(update, 1)
+    [operation] = collection.finished[0]
+    assert operation._doc['$set']['status'] == status
+    assert operation._doc['$set']['progress_percentage'] == progress
+
+
+@pytest.mark.asyncio
+async def test_failed_bulk_write_still_resolves_waiters(collection):
+    collection.error = RuntimeError('connection reset')
+    writer = _get_status_writer()
+    first = writer.enqueue('c1', {'progress': 10})
+    second = writer.enqueue('c2', {'progress': 10})
+
+    await asyncio.wait_for(asyncio.gather(first, second), 1)
+    assert len(collection.calls) == 1
+
+
+def test_new_writer_is_created_for_a_new_event_loop(monkeypatch):
+    monkeypatch.setattr(contract_processor, '_status_writer', None)
+
+    async def writers():
+        return _get_status_writer(), _get_status_writer()
+
+    first, same = asyncio.run(writers())
+    second, _ = asyncio.run(writers())
+
+    assert first is same
+    assert second is not first
+    assert second.loop is not first.loop